@@ -0,0 +1,21 @@
+# _common.py - Shared text helpers (STT + LLM handlers)
+import re
+
+# Casual speech contractions, compiled once at import
+CONTRACTIONS = {
+    r'\bwanna\b': 'want to',
+    r'\bgonna\b': 'going to',
+    r'\bgotta\b': 'got to',
+}
+
+CONTRACTION_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in CONTRACTIONS.items()
+]
+
+
+def expand_contractions(text: str) -> str:
+    """Expand casual contractions (wanna -> want to)."""
+    for pattern, replacement in CONTRACTION_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text
@@ -2,11 +2,15 @@
 import os
 import logging
 import asyncio
+import hashlib
+import json
 import httpx
 import random
 import re
+from collections import OrderedDict
 from dotenv import load_dotenv
 from typing import Dict
+from _common import expand_contractions
 
 load_dotenv()
 
@@ -16,6 +20,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Company-name fix, compiled once at import
+SHAMLA_PATTERN = re.compile(r'\b(sham[bl]a\s*tech?|sham[bl]a)\b', re.IGNORECASE)
+
 
 class ConversationalPersonality:
     """Manages personality traits and natural language variations."""
@@ -121,10 +128,17 @@ class LLMHandler:
         
         self.interaction_count = 0
         
+        # Exact-match LRU cache of raw completions (repeated prompts skip the API)
+        self.response_cache = OrderedDict()
+        self.max_cache_size = 1024
+        
         logger.info("🤖 LLM Handler initialized (optimized mode)")
     
     async def process_text(self, text: str) -> str:
         """Process text with sentiment-aware response (FAST mode)."""
+        if not text or text.isspace():
+            return ""  # Nothing to send; skip payload build and network I/O
+        
         try:
             sentiment = self.sentiment_analyzer.analyze(text)
             processed_text = self._preprocess_transcription(text)
@@ -143,23 +157,9 @@ class LLMHandler:
                 "presence_penalty": 0.2
             }
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             logger.info(f"🤖 Processing [{sentiment['sentiment']}]: {text[:50]}...")
             
-            # CRITICAL: Use async HTTP client
-            response = await self.client.post(
-                self.base_url, 
-                json=payload, 
-                headers=headers
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            response_text = result['choices'][0]['message']['content'].strip()
+            response_text = await self._request_completion(payload)
             
             # Post-process
             response_text = self._post_process_response(response_text, sentiment)
@@ -179,6 +179,9 @@ class LLMHandler:
 
     async def process_text_with_history(self, text: str, conversation_history: list) -> str:
         """Process with context awareness (optimized for voice)."""
+        if not text or text.isspace():
+            return ""  # Nothing to send; skip payload build and network I/O
+        
         try:
             self.interaction_count += 1
             
@@ -211,23 +214,9 @@ class LLMHandler:
                 "presence_penalty": 0.25
             }
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             logger.info(f"🤖 Processing with history [{sentiment['sentiment']}]")
             
-            # Async call
-            response = await self.client.post(
-                self.base_url,
-                json=payload,
-                headers=headers
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            response_text = result['choices'][0]['message']['content'].strip()
+            response_text = await self._request_completion(payload)
             
             response_text = self._post_process_response(response_text, sentiment)
             
@@ -237,6 +226,41 @@ class LLMHandler:
             logger.error(f"❌ Error with history: {e}")
             return self.personality.get_random_error()
 
+    async def _request_completion(self, payload: Dict) -> str:
+        """Call the chat API, serving exact repeats from the LRU cache."""
+        key = hashlib.sha256(json.dumps(
+            [payload["model"], payload["messages"], payload["temperature"]],
+            sort_keys=True
+        ).encode()).hexdigest()
+        
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            self.response_cache.move_to_end(key)
+            logger.debug("⚡ Response cache hit")
+            return cached
+        
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # CRITICAL: Use async HTTP client
+        response = await self.client.post(
+            self.base_url,
+            json=payload,
+            headers=headers
+        )
+        response.raise_for_status()
+        
+        result = response.json()
+        response_text = result['choices'][0]['message']['content'].strip()
+        
+        self.response_cache[key] = response_text
+        if len(self.response_cache) > self.max_cache_size:
+            self.response_cache.popitem(last=False)
+        
+        return response_text
+
     def _preprocess_transcription(self, text: str) -> str:
         """Pre-process transcription."""
         if not text:
@@ -245,18 +269,10 @@ class LLMHandler:
         processed = text
         
         # Fix company name
-        shamla_pattern = re.compile(r'\b(sham[bl]a\s*tech?|sham[bl]a)\b', re.IGNORECASE)
-        processed = shamla_pattern.sub('Shamla Tech', processed)
+        processed = SHAMLA_PATTERN.sub('Shamla Tech', processed)
         
         # Common contractions
-        contractions = {
-            r'\bwanna\b': 'want to',
-            r'\bgonna\b': 'going to',
-            r'\bgotta\b': 'got to',
-        }
-        
-        for pattern, replacement in contractions.items():
-            processed = re.sub(pattern, replacement, processed, flags=re.IGNORECASE)
+        processed = expand_contractions(processed)
         
         return processed.strip()
 
@@ -4,9 +4,15 @@ from llm_handler import LLMHandler
 from tts_handler import TTSHandler
 import asyncio
 import logging
+import os
 import warnings
 import time
 
+try:
+    import uvloop  # Optional faster event loop (not available on Windows)
+except ImportError:
+    uvloop = None
+
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 logging.basicConfig(
@@ -59,7 +65,7 @@ async def handle_conversation_turn(stt_handler, llm_handler, tts_handler,
         (should_continue, should_exit)
     """
     try:
-        turn_start = time.time()
+        turn_start = time.monotonic()
         
         # Step 1: Get user input (STT)
         logger.info("🎤 Listening for speech...")
@@ -73,7 +79,7 @@ async def handle_conversation_turn(stt_handler, llm_handler, tts_handler,
             conversation_manager.record_error()
             return True, False
         
-        stt_time = time.time() - turn_start
+        stt_time = time.monotonic() - turn_start
         print(f"📝 You: {user_text} ({stt_time*1000:.0f}ms)")
         
         # Check for exit commands
@@ -84,7 +90,7 @@ async def handle_conversation_turn(stt_handler, llm_handler, tts_handler,
         conversation_manager.add_turn("User", user_text)
         
         # Step 2: Get AI response (LLM)
-        llm_start = time.time()
+        llm_start = time.monotonic()
         logger.info("🤖 Generating response...")
         
         response = await llm_handler.process_text_with_history(
@@ -92,7 +98,7 @@ async def handle_conversation_turn(stt_handler, llm_handler, tts_handler,
             conversation_manager.get_history()
         )
         
-        llm_time = time.time() - llm_start
+        llm_time = time.monotonic() - llm_start
         
         if not response or len(response.strip()) < 3:
             logger.error("❌ Invalid LLM response")
@@ -105,30 +111,43 @@ async def handle_conversation_turn(stt_handler, llm_handler, tts_handler,
         conversation_manager.add_turn("Agent", response)
         
         # Step 3: Speak response (TTS)
-        tts_start = time.time()
+        tts_start = time.monotonic()
         logger.info("🗣 Speaking response...")
         
         tts_handler.speak(response, enable_barge_in=True)
         
         # Monitor for barge-in during TTS
-        barge_in_start_check = time.time()
+        barge_in_start_check = time.monotonic()
         last_rt_text = ""
+        last_rt_log_ns = 0
+        last_rt_updates = stt_handler.realtime_updates
+        poll_delay = 0.002  # Back-off: short replies finish fast, long ones poll less
         
         # Poll for real-time transcription while TTS is playing
         while tts_handler.is_playing:
-            if time.time() - barge_in_start_check > 0.1:  # Check every 100ms
+            # Check every 100ms, and only if STT produced a new partial
+            if (stt_handler.realtime_updates != last_rt_updates
+                    and time.monotonic() - barge_in_start_check > 0.1):
+                last_rt_updates = stt_handler.realtime_updates
                 rt_text = stt_handler.get_realtime_text()
-                if rt_text and rt_text != last_rt_text and len(rt_text) > 2:
-                    logger.info(f"🎤 Real-time detected during TTS: {rt_text}")
+                # str != short-circuits on identity and length before scanning
+                if len(rt_text) > 2 and rt_text != last_rt_text:
+                    # Lazy %-format, at most one line per 250ms
+                    now_ns = time.monotonic_ns()
+                    if (logger.isEnabledFor(logging.INFO)
+                            and now_ns - last_rt_log_ns > 250_000_000):
+                        logger.info("🎤 Real-time detected during TTS: %s", rt_text)
+                        last_rt_log_ns = now_ns
                     last_rt_text = rt_text
-                barge_in_start_check = time.time()
+                barge_in_start_check = time.monotonic()
             
-            await asyncio.sleep(0.05)  # 50ms polling
+            await asyncio.sleep(poll_delay)
+            poll_delay = min(poll_delay * 1.5, 0.05)  # Capped at 50ms
         # Wait for completion or barge-in
         completed = tts_handler.wait_for_completion(timeout=30.0)
         
-        tts_time = time.time() - tts_start
-        total_time = time.time() - turn_start
+        tts_time = time.monotonic() - tts_start
+        total_time = time.monotonic() - turn_start
         
         # Log performance
         logger.info(f"⏱ Turn timing: STT={stt_time*1000:.0f}ms, "
@@ -164,6 +183,10 @@ async def main():
     """Main conversation loop with robust error handling."""
     logger.info("🚀 Starting AI Voice Agent...")
     
+    # Run new tasks eagerly until their first await (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     stt_handler = None
     tts_handler = None
     
@@ -227,9 +250,6 @@ async def main():
             
             if not should_continue:
                 break
-            
-            # Brief pause between turns
-            await asyncio.sleep(0.1)
         
         if loop_count >= max_turns:
             print("\n⏰ Session limit reached. Thank you for using Shamla Tech!")
@@ -290,6 +310,10 @@ Starting in 3 seconds...
     
     time.sleep(3)
     
+    # Use uvloop when installed; set USE_UVLOOP=0 to force the stock loop
+    if uvloop is not None and os.getenv("USE_UVLOOP", "1") != "0":
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
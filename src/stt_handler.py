@@ -7,6 +7,7 @@ import concurrent.futures
 import re
 import threading
 from RealtimeSTT import AudioToTextRecorder
+from _common import expand_contractions
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
@@ -27,13 +28,16 @@ class STTHandler:
         r'\b(block ?chain)\b': 'blockchain',
         r'\b(crypto ?currency|cripto)\b': 'cryptocurrency',
         
-        # Common casual speech
-        r'\bwanna\b': 'want to',
-        r'\bgonna\b': 'going to',
-        r'\bgotta\b': 'got to',
+        # Common casual speech (wanna/gonna/gotta live in _common)
         r'\blemme\b': 'let me',
     }
     
+    # Compiled once at import instead of re.sub(pattern_str, ...) per call
+    CORRECTION_PATTERNS = [
+        (re.compile(pattern, re.IGNORECASE), replacement)
+        for pattern, replacement in CORRECTIONS.items()
+    ]
+    
     def __init__(self, mode: str = "balanced"):
         """
         Initialize STT with adaptive model selection.
@@ -52,6 +56,8 @@ class STTHandler:
         # Real-time transcription tracking
         self.realtime_text = ""
         self.realtime_lock = threading.Lock()
+        self.speech_event = threading.Event()  # Set on every partial (barge-in wakeup)
+        self.realtime_updates = 0  # Bumped per partial so pollers can skip unchanged text
         
         logger.info(f"🎤 STT Handler initialized (mode: {mode}, model: {self.model_name})")
     
@@ -72,8 +78,9 @@ class STTHandler:
         original = text
         
         # Apply all corrections
-        for pattern, replacement in self.CORRECTIONS.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        for pattern, replacement in self.CORRECTION_PATTERNS:
+            text = pattern.sub(replacement, text)
+        text = expand_contractions(text)
         
         # Log significant corrections
         if original != text:
@@ -85,7 +92,13 @@ class STTHandler:
         """Callback for real-time transcription updates."""
         with self.realtime_lock:
             self.realtime_text = text
+            self.realtime_updates += 1
+        self.speech_event.set()
         # Don't log here (too noisy)
+    
+    def _on_recording_start(self):
+        """Callback when VAD starts a recording (wakes barge-in monitor)."""
+        self.speech_event.set()
         
     async def start_listening(self):
         """Start optimized continuous listening."""
@@ -122,6 +135,9 @@ class STTHandler:
                     silero_use_onnx=True,  # Faster VAD
                     webrtc_sensitivity=2,  # Medium sensitivity (0-3)
                     
+                    # Push VAD start to barge-in monitor (no polling needed)
+                    on_recording_start=self._on_recording_start,
+                    
                     # Performance
                     beam_size=3,  # Balance speed/accuracy (default 5)
                     initial_prompt="Shamla Tech, AI, blockchain, cryptocurrency, API",  # Context hints
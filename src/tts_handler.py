@@ -1,11 +1,12 @@
 # tts_handler.py - FIXED VERSION
 import os
+import sys
 import logging
 import asyncio
+import queue
 import time
 import threading
 import warnings
-import numpy as np
 from RealtimeTTS import SystemEngine, TextToAudioStream
 from RealtimeSTT import AudioToTextRecorder
 
@@ -17,14 +18,89 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _read_poll_interval(default: float = 0.1, floor: float = 0.005) -> float:
+    """Read VOICE_MVP_POLL_INTERVAL, clamped so the monitor never busy-spins."""
+    try:
+        value = float(os.getenv("VOICE_MVP_POLL_INTERVAL", default))
+    except ValueError:
+        logger.warning(f"Invalid VOICE_MVP_POLL_INTERVAL, using {default}s")
+        value = default
+    return max(value, floor)
+
+
+# Barge-in monitor fallback poll (seconds); events normally wake it sooner
+POLL_INTERVAL = _read_poll_interval()
+
+# Optional CPU pinning for TTS worker threads (Linux), e.g. TTS_CPU_AFFINITY="0,1"
+TTS_CPU_AFFINITY = os.getenv("TTS_CPU_AFFINITY", "")
+
+
+# Shared engine: SystemEngine init is slow and safe to reuse across handlers
+_ENGINE = None
+_ENGINE_VOICE = "default"  # Voice currently applied to the shared engine
+_ENGINE_LOCK = threading.Lock()
+
+
+def _get_engine():
+    """Create the SystemEngine on first use, then reuse it."""
+    global _ENGINE
+    with _ENGINE_LOCK:
+        if _ENGINE is None:
+            _ENGINE = SystemEngine()
+        return _ENGINE
+
+
+def _set_engine_voice(engine, voice: str):
+    """Switch the shared engine's voice only when it actually changes."""
+    global _ENGINE_VOICE
+    with _ENGINE_LOCK:
+        if voice != _ENGINE_VOICE:
+            engine.set_voice(voice)  # Re-scans installed voices
+            _ENGINE_VOICE = voice
+
+
+def _pin_thread_cpus():
+    """Pin the calling thread to TTS_CPU_AFFINITY (opt-in, no-op elsewhere)."""
+    if not TTS_CPU_AFFINITY or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        cpus = {int(c) for c in TTS_CPU_AFFINITY.split(",") if c.strip()}
+        os.sched_setaffinity(0, cpus)
+    except (ValueError, OSError) as e:
+        logger.debug(f"CPU affinity unchanged: {e}")
+
+
+def _boost_thread_priority():
+    """Best-effort real-time priority for the calling thread.
+    
+    Linux needs CAP_SYS_NICE (or RLIMIT_RTPRIO) for SCHED_FIFO; without it
+    we fall back to a lower nice value, and otherwise keep default priority.
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 15)  # TIME_CRITICAL
+            return
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        except (AttributeError, OSError):
+            os.nice(-10)
+    except Exception as e:
+        logger.debug(f"Thread priority unchanged: {e}")
+
+
 class TTSHandler:
     """Handles TTS with INSTANT, reliable barge-in detection (<100ms)."""
     
     def __init__(self, stt_handler=None):
         """Initialize TTS with real-time VAD-based barge-in."""
         try:
-            self.engine = SystemEngine()
+            self.engine = _get_engine()
             self.stream = TextToAudioStream(self.engine)
+            self._last_spoken_key = None  # (text, voice, emotive_tags) for debounce
+            self._last_spoken_ns = 0
             
             # Main STT handler (shared)
             self.main_stt = stt_handler
@@ -33,12 +109,13 @@ class TTSHandler:
             # self.barge_in_recorder = None
             # self._init_barge_in_recorder()
             
-            # State management with thread safety
-            self.is_playing = False
-            self.is_barge_in_enabled = True
-            self.barge_in_detected = False
+            # State management with thread safety (events, no lock on reads)
+            self._playing_event = threading.Event()
+            self._barge_in_event = threading.Event()
+            self._done_event = threading.Event()
+            self._done_event.set()  # Nothing playing yet
             self.stop_event = threading.Event()
-            self.state_lock = threading.Lock()
+            self.state_lock = threading.Lock()  # Multi-field updates only
             
             # Real-time speech detection flag (updated by callback)
             # self.speech_detected = False
@@ -55,11 +132,34 @@ class TTSHandler:
             self.last_realtime_text = ""
             self.realtime_text_lock = threading.Lock()
             
+            # Persistent playback + monitor workers (no thread spawn per utterance)
+            self._speak_q = queue.SimpleQueue()
+            self._pending_jobs = 0  # Queued + playing utterances (under state_lock)
+            self._monitor_job = 0  # Job id handed to the monitor on wakeup
+            self._active_job = 0  # Id of the utterance now playing (0 = none)
+            self._job_counter = 0
+            self._playback_started_event = threading.Event()
+            self._monitor_ready = threading.Event()
+            self.playback_thread = threading.Thread(target=self._speak_worker, daemon=True)
+            self.monitor_thread = threading.Thread(target=self._monitor_worker, daemon=True)
+            self.playback_thread.start()
+            self.monitor_thread.start()
+            
             logger.info("🎤 TTS Handler initialized with INSTANT barge-in (VAD-based).")
         except Exception as e:
             logger.error(f"❌ Error initializing TTS: {e}")
             raise
     
+    @property
+    def is_playing(self) -> bool:
+        """True while an utterance is queued or playing."""
+        return self._playing_event.is_set()
+    
+    @property
+    def barge_in_detected(self) -> bool:
+        """True if the current/last utterance was interrupted."""
+        return self._barge_in_event.is_set()
+    
     def _init_barge_in_recorder(self):
         """Initialize lightweight STT with REAL-TIME callbacks for instant detection."""
         try:
@@ -68,7 +168,7 @@ class TTSHandler:
                 """Called IMMEDIATELY when speech is detected (VAD trigger)."""
                 with self.state_lock:
                     self.speech_detected = True
-                    self.speech_start_time = time.time()
+                    self.speech_start_time = time.monotonic()
                 logger.debug("🎤 Speech START detected (VAD)")
             
             def on_recording_stop():
@@ -117,7 +217,7 @@ class TTSHandler:
         except Exception as e:
             logger.warning(f"Calibration failed: {e}")
     
-    def _playback_with_barge_in(self, text: str):
+    def _playback_with_barge_in(self, text: str, enable_barge_in: bool = True):
         """Play audio with INSTANT VAD-based barge-in monitoring (<100ms stop)."""
       
         # def monitor_speech():
@@ -191,95 +291,161 @@ class TTSHandler:
         #     except Exception as e:
         #         logger.error(f"❌ Barge-in monitor error: {e}")
                 
-        def monitor_speech():
-            """Energy-based VAD monitoring using main STT."""
+        # Mark playing before queueing so waiters never see stale state
+        with self.state_lock:
+            self._pending_jobs += 1
+            self._barge_in_event.clear()
+            self._done_event.clear()
+            self._playing_event.set()
+        
+        # Hand off to the persistent playback worker
+        self._speak_q.put(lambda: self._play_audio(text, enable_barge_in))
+    
+    def _speak_worker(self):
+        """Run queued playback jobs on one long-lived thread."""
+        # Normal priority: synthesis runs here (and in threads it spawns, which
+        # inherit the policy), so boosting it could starve the STT/VAD threads
+        _pin_thread_cpus()
+        while True:
+            job = self._speak_q.get()
+            if job is None:  # Shutdown sentinel
+                break
             try:
-                if not (self.is_barge_in_enabled and self.main_stt and self.main_stt.recorder):
-                    return
-                
-                playback_start = time.time()
-                tts_buffer = 0.2
+                job()
+            except Exception as e:
+                # Keep the only playback thread alive for later utterances
+                logger.error(f"❌ Playback worker error: {e}")
+    
+    def _monitor_worker(self):
+        """Run the barge-in monitor for each playback on one long-lived thread."""
+        _boost_thread_priority()
+        _pin_thread_cpus()
+        while True:
+            self._playback_started_event.wait()
+            self._playback_started_event.clear()
+            if self.stream is None:  # Shut down
+                break
+            self._monitor_barge_in(self._monitor_job)
+    
+    def _monitor_barge_in(self, job_id: int):
+        """Energy-based VAD monitoring using main STT."""
+        self._monitor_ready.set()
+        try:
+            # Woken late: the utterance that woke us has already finished
+            if job_id == 0 or self._active_job != job_id:
+                return
+            
+            if not (self.main_stt and self.main_stt.recorder):
+                return
+            
+            # Resolve the recorder once; RealtimeSTT has is_recording property
+            recorder = self.main_stt.recorder
+            if not hasattr(recorder, 'is_recording'):
+                logger.warning("⚠️ Barge-in disabled (recorder has no VAD state)")
+                return
+            
+            speech_event = self.main_stt.speech_event
+            
+            # Ignore first 200ms (TTS startup); integer-ns deadline computed once
+            startup_deadline_ns = time.monotonic_ns() + 200_000_000
+            past_startup = False
+            
+            # Access VAD state from main recorder
+            while not self.stop_event.is_set():
+                if self._active_job != job_id:  # Utterance finished
+                    break
                 
-                # Access VAD state from main recorder
-                while not self.stop_event.is_set():
-                    with self.state_lock:
-                        if not self.is_playing:
-                            break
-                    
-                    if time.time() - playback_start < tts_buffer:
+                if not past_startup:
+                    if time.monotonic_ns() < startup_deadline_ns:
                         time.sleep(0.02)
                         continue
-                    
-                    # Check if main recorder detects voice activity
-                    try:
-                        recorder = self.main_stt.recorder
-                        
-                        # RealtimeSTT has is_recording property
-                        if hasattr(recorder, 'is_recording') and recorder.is_recording:
-                            logger.info("🎤 BARGE-IN: Voice activity detected")
-                            
-                            with self.state_lock:
-                                self.barge_in_detected = True
-                                self.stop_event.set()
-                            
-                            if self.stream:
-                                self.stream.stop()
-                                logger.info("🛑 Audio stopped")
-                            break
-                    
-                    except Exception as e:
-                        logger.debug(f"VAD check error: {e}")
-                    
-                    time.sleep(0.02)  # 20ms polling
-                    
-            except Exception as e:
-                logger.error(f"❌ Monitor error: {e}")
-                
-                
-        def play_audio():
-            """Play audio stream with monitoring."""
-            try:
-                with self.state_lock:
-                    self.is_playing = True
-                    self.barge_in_detected = False
-                    self.speech_detected = False
-                self.stop_event.clear()
+                    past_startup = True
+                    speech_event.clear()  # Drop partials from the startup window
                 
-                # Start monitoring thread BEFORE audio starts
-                monitor_thread = threading.Thread(target=monitor_speech, daemon=True)
-                monitor_thread.start()
+                # Check if main recorder detects voice activity
+                try:
+                    if recorder.is_recording:
+                        logger.info("🎤 BARGE-IN: Voice activity detected")
+                        self.stop_playback()
+                        break
                 
-                # Brief delay to ensure monitor is running
-                time.sleep(0.01)
+                except Exception as e:
+                    logger.debug("VAD check error: %s", e)
                 
-                # Play audio
-                if self.stream:
-                    self.stream.feed(text)
-                    try:
-                        self.stream.play()
-                    except Exception as e:
-                        if not self.stop_event.is_set():
-                            logger.error(f"❌ Playback error: {e}")
+                # Wake instantly on VAD start / STT partials; slow poll as fallback
+                if speech_event.wait(timeout=POLL_INTERVAL):
+                    speech_event.clear()
                 
-            except Exception as e:
-                logger.error(f"❌ Playback error: {e}")
-            finally:
-                with self.state_lock:
-                    self.is_playing = False
-                self.stop_event.clear()
-        
-        # Start playback in thread
-        self.playback_thread = threading.Thread(target=play_audio, daemon=True)
-        self.playback_thread.start()
+        except Exception as e:
+            logger.error(f"❌ Monitor error: {e}")
+    
+    def _play_audio(self, text: str, enable_barge_in: bool):
+        """Play audio stream with monitoring."""
+        with self.state_lock:
+            self._job_counter += 1
+            self._active_job = job_id = self._job_counter
+            self._playing_event.set()
+            self._done_event.clear()
+        try:
+            self.speech_detected = False  # Single store, no lock needed
+            self.stop_event.clear()
+            
+            # Wake the monitor BEFORE audio starts and wait until it is running
+            # (skipped entirely when barge-in is off, e.g. the welcome message)
+            if enable_barge_in and self.main_stt:
+                self._monitor_ready.clear()
+                self._monitor_job = job_id  # Handshake: which utterance to watch
+                self._playback_started_event.set()
+                self._monitor_ready.wait(timeout=0.05)
+            
+            # Play audio
+            if self.stream:
+                self.stream.feed(text)
+                try:
+                    self.stream.play(
+                        # Progressive start: short first fragment, full sentences after
+                        fast_sentence_fragment=True,
+                        minimum_first_fragment_length=10,
+                        force_first_fragment_after_words=8,  # Default 30
+                    )
+                except Exception as e:
+                    if not self.stop_event.is_set():
+                        logger.error(f"❌ Playback error: {e}")
+            
+        except Exception as e:
+            logger.error(f"❌ Playback error: {e}")
+        finally:
+            # Only go idle once no other utterance is queued behind this one
+            with self.state_lock:
+                self._active_job = 0
+                self._pending_jobs -= 1
+                if self._pending_jobs == 0:
+                    self._playing_event.clear()
+                    self._done_event.set()
+            self.stop_event.clear()
+            if self.main_stt:
+                self.main_stt.speech_event.set()  # Wake the monitor so it exits now
     
     def speak(self, text: str, voice: str = "default", emotive_tags: str = "", 
               enable_barge_in: bool = True) -> str:
         """Convert text to speech with INSTANT barge-in capability."""
         try:
+            # Nothing to say: skip all downstream work
+            text = text.strip() if text else ""
+            if not text:
+                return ""
+            
             if not self.engine or not self.stream:
                 raise ValueError("TTS not initialized")
             
-            self.is_barge_in_enabled = enable_barge_in
+            # Debounce duplicate speaks (e.g. upstream retries) within 200ms
+            key = (text, voice, emotive_tags)
+            now_ns = time.monotonic_ns()
+            if key == self._last_spoken_key and now_ns - self._last_spoken_ns < 200_000_000:
+                return "audio_playing"
+            self._last_spoken_key = key
+            self._last_spoken_ns = now_ns
+            
             logger.info(f"🗣 Speaking: {text[:50]}...")
             
             if emotive_tags:
@@ -287,11 +453,11 @@ class TTSHandler:
             
             if voice != "default":
                 try:
-                    self.engine.set_voice(voice)
+                    _set_engine_voice(self.engine, voice)
                 except Exception as e:
                     logger.warning(f"Voice '{voice}' unavailable: {e}")
             
-            self._playback_with_barge_in(text)
+            self._playback_with_barge_in(text, enable_barge_in)
             
             return "audio_playing"
             
@@ -302,38 +468,71 @@ class TTSHandler:
     def wait_for_completion(self, timeout: float = 30.0) -> bool:
         """Wait for playback completion or barge-in."""
         try:
-            start_time = time.time()
-            
-            while True:
-                with self.state_lock:
-                    if not self.is_playing:
-                        return not self.barge_in_detected
-                    if self.barge_in_detected:
-                        return False
-                
-                if time.time() - start_time > timeout:
-                    logger.warning("⏰ Playback timeout")
-                    return False
-                
-                time.sleep(0.01)  # Fast polling (10ms)
+            # Blocking wait (set on completion or barge-in), no polling
+            if not self._done_event.wait(timeout=timeout):
+                logger.warning("⏰ Playback timeout")
+                return False
+            return not self._barge_in_event.is_set()
                 
         except Exception as e:
             logger.error(f"❌ Wait error: {e}")
             return False
     
+    def stop_playback(self):
+        """Interrupt playback immediately (barge-in). Lock-free."""
+        self._barge_in_event.set()
+        self.stop_event.set()
+        self._last_spoken_key = None  # A retry after barge-in must play again
+        self._drop_pending()
+        
+        # Local ref: shutdown() may clear self.stream concurrently
+        stream = self.stream
+        if stream is not None:
+            try:
+                stream.stop()
+                logger.info("🛑 Audio stopped")
+            except Exception as e:
+                logger.error(f"Stop failed: {e}")
+        
+        # Release waiters now, unless a newer utterance was queued meanwhile
+        # (the playback worker's finally handles playing/done for that one)
+        with self.state_lock:
+            if self._pending_jobs <= (1 if self._active_job else 0):
+                self._done_event.set()
+    
+    def _drop_pending(self):
+        """Discard queued utterances so nothing stale plays after a barge-in."""
+        dropped = 0
+        while True:
+            try:
+                job = self._speak_q.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:  # Keep the shutdown sentinel
+                self._speak_q.put(None)
+                break
+            dropped += 1
+        if dropped:
+            with self.state_lock:
+                self._pending_jobs -= dropped
+                # Nothing playing either: no worker finally will go idle for us
+                if self._pending_jobs == 0:
+                    self._playing_event.clear()
+                    self._done_event.set()
+            logger.info(f"🗑 Dropped {dropped} queued utterance(s)")
+    
     def is_barge_in_detected(self) -> bool:
         """Check if barge-in occurred."""
-        with self.state_lock:
-            return self.barge_in_detected
+        return self._barge_in_event.is_set()
     
     def shutdown(self):
         """Clean shutdown with resource cleanup."""
         try:
             logger.info("🧹 Shutting down TTS...")
             
-            with self.state_lock:
-                self.is_playing = False
+            self._playing_event.clear()
             self.stop_event.set()
+            self._done_event.set()
             
             # Stop streams
             if hasattr(self, 'stream') and self.stream:
@@ -347,6 +546,10 @@ class TTSHandler:
             if hasattr(self, 'engine'):
                 self.engine = None
             
+            # Release the persistent workers
+            self._speak_q.put(None)
+            self._playback_started_event.set()
+            
             # # Cleanup barge-in recorder (don't call shutdown, just dereference)
             # if self.barge_in_recorder:
             #     self.barge_in_recorder = None